@@ -27,6 +27,7 @@ Classes
    ManagedJobSet
    ManagedJob
    ManagedResults
+   CombinedResultView
 
 Exceptions
 ==========================
@@ -44,5 +45,5 @@ Exceptions
 from .ibmqjobmanager import IBMQJobManager
 from .managedjobset import ManagedJobSet
 from .managedjob import ManagedJob
-from .managedresults import ManagedResults
+from .managedresults import ManagedResults, CombinedResultView
 from .exceptions import *
@@ -16,6 +16,7 @@ from datetime import datetime
 from typing import List, Optional, Union, Any, Tuple
 from concurrent.futures import ThreadPoolExecutor
 import time
+import bisect
 import logging
 import uuid
 import threading
@@ -68,6 +69,7 @@ class ManagedJobSet:
             short_id: Short ID for this set of jobs.
         """
         self._managed_jobs = []  # type: List[ManagedJob]
+        self._start_indexes = []  # type: List[int]
         self._name = name or datetime.utcnow().isoformat()
         self._backend = None  # type: Optional[IBMQBackend]
         self._id = short_id or uuid.uuid4().hex + '-' + str(time.time()).replace('.', '')
@@ -127,6 +129,7 @@ class ManagedJobSet:
                         submit_lock=self._job_submit_lock, **run_config)
             logger.debug("Job %s submitted", i+1)
             self._managed_jobs.append(mjob)
+            self._start_indexes.append(mjob.start_index)
             exp_index += len(experiments)
 
     def retrieve_jobs(self, provider: AccountProvider, refresh: bool = False) -> None:
@@ -187,6 +190,7 @@ class ManagedJobSet:
                 'Unable to retrieve all jobs for job set {}.'.format(self.job_set_id()))
 
         self._managed_jobs = []
+        self._start_indexes = []
         experiment_index = 0
         for job_index in sorted_indexes:
             job = jobs_dict[job_index]
@@ -196,6 +200,7 @@ class ManagedJobSet:
                 job=job
             )
             self._managed_jobs.append(mjob)
+            self._start_indexes.append(mjob.start_index)
             experiment_index = mjob.end_index + 1
 
     def statuses(self) -> List[Union[JobStatus, None]]:
@@ -389,20 +394,45 @@ class ManagedJobSet:
                 be found.
         """
         if isinstance(experiment, int):
-            for mjob in self._managed_jobs:
-                if mjob.end_index >= experiment >= mjob.start_index:
-                    return mjob.job, experiment - mjob.start_index
-        else:
-            if isinstance(experiment, (QuantumCircuit, Schedule)):
-                experiment = experiment.name
-            for job in self.jobs():
-                for i, exp in enumerate(job.qobj().experiments):
-                    if hasattr(exp.header, 'name') and exp.header.name == experiment:
-                        return job, i
+            return self.job_by_index(experiment)
+
+        if isinstance(experiment, (QuantumCircuit, Schedule)):
+            experiment = experiment.name
+        for job in self.jobs():
+            for i, exp in enumerate(job.qobj().experiments):
+                if hasattr(exp.header, 'name') and exp.header.name == experiment:
+                    return job, i
 
         raise IBMQJobManagerJobNotFound(
             'Unable to find the job for experiment {}.'.format(experiment))
 
+    @requires_submit
+    def job_by_index(self, index: int) -> Tuple[Optional[IBMQJob], int]:
+        """Retrieve the job used to submit the experiment at the specified position.
+
+        This is equivalent to :meth:`job()` called with an integer, without
+        the dispatch on the experiment type.
+
+        Args:
+            index: The position of the experiment.
+
+        Returns:
+            A tuple of the job used to submit the experiment, or ``None`` if
+            the job submit failed, and the experiment index.
+
+        Raises:
+            IBMQJobManagerJobNotFound: If the job for the experiment could not
+                be found.
+        """
+        job_pos = bisect.bisect_right(self._start_indexes, index) - 1
+        if job_pos >= 0:
+            mjob = self._managed_jobs[job_pos]
+            if index <= mjob.end_index:
+                return mjob.job, index - mjob.start_index
+
+        raise IBMQJobManagerJobNotFound(
+            'Unable to find the job for experiment {}.'.format(index))
+
     @requires_submit
     def qobjs(self) -> List[Union[QasmQobj, PulseQobj]]:
         """Return the Qobjs for the jobs in this set.
@@ -12,18 +12,32 @@
 
 """Results managed by the Job Manager."""
 
-from typing import List, Optional, Union, Tuple, Dict
-import copy
+from typing import List, Optional, Union, Tuple, Dict, Any, Iterator, TYPE_CHECKING
+from collections.abc import Sequence
+import bisect
+import itertools
+from copy import copy as shallow_copy
 
-import numpy  # pylint: disable=unused-import
 from qiskit.result import Result
 from qiskit.circuit import QuantumCircuit
 from qiskit.pulse import Schedule
 
 from qiskit_ibm.managed import managedjobset  # pylint: disable=unused-import
-from .exceptions import IBMQManagedResultDataNotAvailable
+from .exceptions import IBMQManagedResultDataNotAvailable, IBMQJobManagerJobNotFound
 from ..job.exceptions import JobError
 
+if TYPE_CHECKING:
+    import numpy
+    from ..job import IBMQJob
+
+# ``Result`` methods wrapped by ``ManagedResults``, resolved once.
+_RESULT_METHODS = {name: getattr(Result, name) for name in (
+    'data', 'get_memory', 'get_counts', 'get_statevector', 'get_unitary')}
+
+# Methods whose output is cached. There is one entry per experiment, and a
+# copy of the cached output is returned on every call.
+_CACHED_RESULT_METHODS = ('get_memory', 'get_counts')
+
 
 class ManagedResults:
     """Results managed by the Job Manager.
@@ -33,6 +47,9 @@ class ManagedResults:
     :class:`~qiskit.result.Result` class for more information on the methods.
     """
 
+    __slots__ = ('_job_set', 'backend_name', 'success', '_combined_results',
+                 '_result_cache', '_output_cache', '_exp_index', '_exp_names_indexed')
+
     def __init__(
             self,
             job_set: 'managedjobset.ManagedJobSet',
@@ -55,6 +72,10 @@ class ManagedResults:
         self.backend_name = backend_name
         self.success = success
         self._combined_results = None  # type: Optional[Result]
+        self._result_cache = {}  # type: Dict[str, Result]
+        self._output_cache = {}  # type: Dict[Tuple[str, str, int], Any]
+        self._exp_index = {}  # type: Dict[Union[str, int], Tuple[Optional[IBMQJob], int]]
+        self._exp_names_indexed = False
 
     def data(self, experiment: Union[str, QuantumCircuit, Schedule, int]) -> Dict:
         """Get the raw data for an experiment.
@@ -77,12 +98,13 @@ class ManagedResults:
             IBMQJobManagerJobNotFound: If the job for the experiment could not
                 be found.
         """
-        result, exp_index = self._get_result(experiment)
-        return result.data(exp_index)
+        return self._call_result_method('data', experiment)
 
     def get_memory(
             self,
-            experiment: Union[str, QuantumCircuit, Schedule, int]
+            experiment: Union[str, QuantumCircuit, Schedule, int],
+            *,
+            as_array: bool = False
     ) -> Union[list, 'numpy.ndarray']:
         """Get the sequence of memory states (readouts) for each shot.
         The data from the experiment is a list of format
@@ -90,18 +112,44 @@ class ManagedResults:
 
         Args:
             experiment: Retrieve result for this experiment, as specified by :meth:`data()`.
+            as_array: If ``True`` and the memory is a list of bitstrings, return
+                it as a ``(shots, bits)`` array of ``uint8`` bit values instead,
+                with the bits of each shot in the same order as in its bitstring.
+                Register separators are discarded.
 
         Returns:
             Refer to the :meth:`Result.get_memory()<qiskit.result.Result.get_memory()>`
-            for information on return data.
+            for information on return data. If ``as_array`` is ``True`` and the
+            memory is a list of bitstrings, a ``(shots, bits)`` ``numpy.ndarray``
+            of ``uint8`` bit values is returned instead.
 
         Raises:
-            IBMQManagedResultDataNotAvailable: If data for the experiment could not be retrieved.
+            IBMQManagedResultDataNotAvailable: If data for the experiment could not be
+                retrieved, or ``as_array`` is ``True`` and the shots have
+                different lengths.
             IBMQJobManagerJobNotFound: If the job for the experiment could not
                 be found.
         """
-        result, exp_index = self._get_result(experiment)
-        return result.get_memory(exp_index)
+        # The array is built from the cached list, so it does not need a copy.
+        memory = self._call_result_method('get_memory', experiment, copy_output=not as_array)
+        if not as_array:
+            return memory
+        if not isinstance(memory, list):
+            return shallow_copy(memory)
+
+        shots = []
+        num_bits = len(memory[0].replace(' ', '')) if memory else 0
+        for shot in memory:
+            shot = shot.replace(' ', '')
+            if len(shot) != num_bits:
+                raise IBMQManagedResultDataNotAvailable(
+                    'Memory for experiment {} cannot be returned as an array since '
+                    'its shots have different lengths.'.format(experiment))
+            shots.append(shot)
+
+        import numpy  # pylint: disable=redefined-outer-name
+        bits = numpy.frombuffer(''.join(shots).encode('ascii'), dtype=numpy.uint8) - ord('0')
+        return bits.reshape(len(shots), num_bits)
 
     def get_counts(
             self,
@@ -121,8 +169,7 @@ class ManagedResults:
             IBMQJobManagerJobNotFound: If the job for the experiment could not
                 be found.
         """
-        result, exp_index = self._get_result(experiment)
-        return result.get_counts(exp_index)
+        return self._call_result_method('get_counts', experiment)
 
     def get_statevector(
             self,
@@ -145,8 +192,7 @@ class ManagedResults:
             IBMQJobManagerJobNotFound: If the job for the experiment could not
                 be found.
         """
-        result, exp_index = self._get_result(experiment)
-        return result.get_statevector(experiment=exp_index, decimals=decimals)
+        return self._call_result_method('get_statevector', experiment, decimals)
 
     def get_unitary(
             self,
@@ -169,65 +215,276 @@ class ManagedResults:
             IBMQJobManagerJobNotFound: If the job for the experiment could not
                 be found.
         """
-        result, exp_index = self._get_result(experiment)
-        return result.get_unitary(experiment=exp_index, decimals=decimals)
+        return self._call_result_method('get_unitary', experiment, decimals)
 
-    def combine_results(self) -> Result:
+    def combine_results(self, copy: bool = True) -> Union[Result, 'CombinedResultView']:
         """Combine results from all jobs into a single `Result`.
 
         Note:
             Since the order of the results must match the order of the initial
             experiments, job results can only be combined if all jobs succeeded.
 
+        Args:
+            copy: If ``True``, return a new :class:`~qiskit.result.Result`
+                containing the experiment results of all jobs. If ``False``,
+                return a :class:`CombinedResultView` that looks up experiments
+                in the results of the individual jobs instead.
+
         Returns:
-            A :class:`~qiskit.result.Result` object that contains results from
-                all jobs.
+            A :class:`~qiskit.result.Result` object, or a
+                :class:`CombinedResultView` if ``copy`` is ``False``, that
+                contains results from all jobs.
         Raises:
             IBMQManagedResultDataNotAvailable: If results cannot be combined
                 because some jobs failed.
         """
-        if self._combined_results:
+        if copy and self._combined_results is not None:
             return self._combined_results
 
         if not self.success:
             raise IBMQManagedResultDataNotAvailable(
                 "Results cannot be combined since some of the jobs failed.")
 
-        jobs = self._job_set.jobs()
-        combined_result = copy.deepcopy(jobs[0].result())
-        for idx in range(1, len(jobs)):
-            combined_result.results.extend(jobs[idx].result().results)
+        job_results = [self._get_job_result(job) for job in self._job_set.jobs()]
+
+        if not copy:
+            return CombinedResultView(self, job_results)
+
+        # Jobs cache their results, so only the top-level ``Result`` is copied
+        # and given a new ``results`` list. Experiment results are shared, not cloned.
+        combined_result = shallow_copy(job_results[0])
+        combined_result.results = list(itertools.chain.from_iterable(
+            result.results for result in job_results))
 
         self._combined_results = combined_result
         return combined_result
 
-    def _get_result(
+    def _call_result_method(
             self,
-            experiment: Union[str, QuantumCircuit, Schedule, int]
-    ) -> Tuple[Result, int]:
-        """Get the result of the job used to submit the experiment.
+            name: str,
+            experiment: Union[str, QuantumCircuit, Schedule, int],
+            *args: Any,
+            copy_output: bool = True
+    ) -> Any:
+        """Call a ``Result`` method for an experiment.
+
+        The output of the methods in ``_CACHED_RESULT_METHODS`` is cached, and
+        a shallow copy of it is returned so callers cannot modify the cache.
 
         Args:
+            name: Name of the :class:`~qiskit.result.Result` method.
             experiment: Retrieve result for this experiment, as specified by :meth:`data()`.
+            args: Additional arguments to be passed to the method.
+            copy_output: If ``False``, return the cached output itself. Only for
+                callers that do not modify or expose it.
 
         Returns:
-            A tuple of the result of the job used to submit the experiment and
-                the experiment index within the job.
+            The output of the method.
 
         Raises:
             IBMQManagedResultDataNotAvailable: If data for the experiment could not be retrieved.
             IBMQJobManagerJobNotFound: If the job for the experiment could not
                 be found.
         """
+        job, exp_index = self._find_job(experiment)
+        result = self._get_job_result(job, experiment)
+        if name not in _CACHED_RESULT_METHODS:
+            return _RESULT_METHODS[name](result, exp_index, *args)
+
+        key = (name, job.job_id(), exp_index)
+        if key not in self._output_cache:
+            self._output_cache[key] = _RESULT_METHODS[name](result, exp_index)
+        output = self._output_cache[key]
+        return shallow_copy(output) if copy_output else output
+
+    def _find_job(
+            self,
+            experiment: Union[str, QuantumCircuit, Schedule, int]
+    ) -> Tuple['IBMQJob', int]:
+        """Find the job used to submit the experiment.
+
+        Args:
+            experiment: Retrieve the job for this experiment, as specified by :meth:`data()`.
+
+        Returns:
+            A tuple of the job used to submit the experiment and the experiment
+                index within the job.
+
+        Raises:
+            IBMQManagedResultDataNotAvailable: If the job for the experiment was
+                not successfully submitted.
+            IBMQJobManagerJobNotFound: If the job for the experiment could not
+                be found.
+        """
+        if isinstance(experiment, int):
+            try:
+                (job, exp_index) = self._exp_index[experiment]
+            except KeyError:
+                (job, exp_index) = self._job_set.job_by_index(experiment)
+                self._exp_index[experiment] = (job, exp_index)
+        else:
+            # Circuits and schedules are looked up by name. They define ``__eq__``
+            # and are not hashable, so they cannot be cached as keys themselves.
+            name = experiment if isinstance(experiment, str) else experiment.name
+            if not self._exp_names_indexed:
+                self._index_experiment_names()
+            try:
+                (job, exp_index) = self._exp_index[name]
+            except KeyError:
+                raise IBMQJobManagerJobNotFound(
+                    'Unable to find the job for experiment {}.'.format(experiment)) from None
 
-        (job, exp_index) = self._job_set.job(experiment)
         if job is None:
             raise IBMQManagedResultDataNotAvailable(
                 'Job for experiment {} was not successfully submitted.'.format(experiment))
+        return job, exp_index
 
-        try:
-            result = job.result()
-            return result, exp_index
-        except JobError as err:
-            raise IBMQManagedResultDataNotAvailable(
-                'Result data for experiment {} is not available.'.format(experiment)) from err
+    def _get_job_result(
+            self,
+            job: 'IBMQJob',
+            experiment: Optional[Union[str, QuantumCircuit, Schedule, int]] = None
+    ) -> Result:
+        """Get the result of a job, retrieving it only once.
+
+        Args:
+            job: The job.
+            experiment: The experiment the result is needed for, used in error
+                messages. If ``None``, the error messages name the job instead.
+
+        Returns:
+            The result of the job.
+
+        Raises:
+            IBMQManagedResultDataNotAvailable: If the result of the job could not be retrieved.
+        """
+        job_id = job.job_id()
+        result = self._result_cache.get(job_id)
+        if result is None:
+            try:
+                result = job.result()
+            except JobError as err:
+                if experiment is None:
+                    message = 'Result data for job {} is not available.'.format(job_id)
+                else:
+                    message = 'Result data for experiment {} is not available.'.format(
+                        experiment)
+                raise IBMQManagedResultDataNotAvailable(message) from err
+            self._result_cache[job_id] = result
+        return result
+
+    def _index_experiment_names(self) -> None:
+        """Add the experiment names to the experiment index.
+
+        Each name is mapped to the job used to submit the experiment and the
+        experiment index within the job. If several experiments share a name,
+        the first one is used.
+        """
+        for job in self._job_set.jobs():
+            if job is None:
+                continue
+            for i, exp in enumerate(job.qobj().experiments):
+                if hasattr(exp.header, 'name'):
+                    self._exp_index.setdefault(exp.header.name, (job, i))
+        self._exp_names_indexed = True
+
+
+class CombinedResultView:
+    """Read-only view of the combined results of several jobs.
+
+    An instance of this class is returned by
+    :meth:`ManagedResults.combine_results()` when ``copy`` is ``False``.
+    The results of the jobs are not copied.
+
+    The view provides the ``data()``, ``get_memory()``, ``get_counts()``,
+    ``get_statevector()`` and ``get_unitary()`` methods of
+    :class:`ManagedResults`, which it delegates to. As with
+    :class:`~qiskit.result.Result`, negative positions count from the last
+    experiment, but an experiment must always be specified.
+
+    The ``results`` attribute is a read-only sequence of the experiment
+    results of all jobs. The ``backend_name``, ``backend_version``,
+    ``qobj_id``, ``job_id``, ``date``, ``status`` and ``header`` attributes
+    are those of the first job, as in the combined ``Result``. Other
+    ``Result`` methods, such as ``to_dict()``, are not supported.
+    """
+
+    def __init__(self, managed_results: ManagedResults, job_results: List[Result]):
+        """CombinedResultView constructor.
+
+        Args:
+            managed_results: Managed results used to look up experiments.
+            job_results: Results of the jobs, in the order the experiments
+                were submitted.
+        """
+        self._managed_results = managed_results
+        self.results = _ChainedExperimentResults(job_results)
+
+        first_result = job_results[0]
+        self.backend_name = first_result.backend_name
+        self.backend_version = first_result.backend_version
+        self.qobj_id = first_result.qobj_id
+        self.job_id = first_result.job_id
+        self.date = first_result.date
+        self.status = first_result.status
+        self.header = first_result.header
+        self.success = managed_results.success
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _RESULT_METHODS:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                type(self).__name__, name))
+        method = getattr(self._managed_results, name)
+
+        def _method(
+                experiment: Union[str, QuantumCircuit, Schedule, int],
+                *args: Any,
+                **kwargs: Any
+        ) -> Any:
+            if isinstance(experiment, int) and experiment < 0:
+                experiment += len(self.results)
+            return method(experiment, *args, **kwargs)
+
+        return _method
+
+
+class _ChainedExperimentResults(Sequence):
+    """Read-only sequence of the experiment results of several jobs.
+
+    A position is mapped to the result of a job and the index within it using
+    the cumulative offsets of the jobs.
+    """
+
+    def __init__(self, job_results: List[Result]):
+        """_ChainedExperimentResults constructor.
+
+        Args:
+            job_results: Results of the jobs, in the order the experiments
+                were submitted.
+        """
+        # Jobs without experiment results are skipped so offsets are unique.
+        self._job_results = [result for result in job_results if result.results]
+        self._offsets = []  # type: List[int]
+        total = 0
+        for result in self._job_results:
+            self._offsets.append(total)
+            total += len(result.results)
+        self._size = total
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('Experiment result index out of range.')
+        job_pos = bisect.bisect_right(self._offsets, index) - 1
+        return self._job_results[job_pos].results[index - self._offsets[job_pos]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return itertools.chain.from_iterable(result.results for result in self._job_results)
@@ -19,7 +19,7 @@ import uuid
 from concurrent.futures import wait
 from datetime import datetime, timedelta
 
-from qiskit import QuantumCircuit
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.providers.jobstatus import JobStatus
 from qiskit.result import Result
 from qiskit.test.reference_circuits import ReferenceCircuits
@@ -394,6 +394,24 @@ class TestIBMQJobManager(IBMQTestCase):
         with self.assertRaises(IBMQJobManagerJobNotFound):
             result_manager.get_counts(1)
 
+    def test_job_by_index(self):
+        """Test retrieving the job of an experiment by its position."""
+        max_per_job = 2
+        job_set = self._jm.run([self._qc]*5, backend=self.fake_api_backend,
+                               max_experiments_per_job=max_per_job)
+        jobs = job_set.jobs()
+
+        for i in range(5):
+            with self.subTest(i=i):
+                job, exp_index = job_set.job_by_index(i)
+                self.assertEqual(job.job_id(), jobs[i // max_per_job].job_id())
+                self.assertEqual(exp_index, i % max_per_job)
+
+        for i in [-1, 5]:
+            with self.subTest(i=i):
+                with self.assertRaises(IBMQJobManagerJobNotFound):
+                    job_set.job_by_index(i)
+
     def test_skipped_result(self):
         """Test one of jobs has no result."""
         self.fake_api_backend._api_client = BaseFakeAccountClient(
@@ -419,6 +437,111 @@ class TestIBMQJobManager(IBMQTestCase):
         for i in range(max_per_job*2):
             self.assertEqual(result_manager.get_counts(i), combined_result.get_counts(i))
 
+    def test_cached_results_independent(self):
+        """Test repeated calls return equal but independent objects."""
+        job_set = self._jm.run([self._qc]*2, backend=self.fake_api_backend,
+                               max_experiments_per_job=1)
+        result_manager = job_set.results()
+
+        counts = result_manager.get_counts(1)
+        expected_counts = dict(counts)
+        self.assertEqual(result_manager.get_counts(1), counts)
+        self.assertIsNot(result_manager.get_counts(1), counts)
+
+        counts.pop(next(iter(counts)))
+        self.assertEqual(result_manager.get_counts(1), expected_counts)
+
+        data = result_manager.data(1)
+        self.assertEqual(result_manager.data(1), data)
+        self.assertIsNot(result_manager.data(1), data)
+
+    def test_combine_results_single_job(self):
+        """Test combining the results of a job set with a single job."""
+        job_set = self._jm.run([self._qc]*3, backend=self.fake_api_backend,
+                               max_experiments_per_job=5)
+        self.assertEqual(len(job_set.jobs()), 1)
+        job_result = job_set.jobs()[0].result()
+        result_manager = job_set.results()
+        combined_result = result_manager.combine_results()
+
+        self.assertIsNot(combined_result, job_result)
+        self.assertIsNot(combined_result.results, job_result.results)
+        for i in range(3):
+            self.assertEqual(result_manager.get_counts(i), combined_result.get_counts(i))
+
+        combined_result.results.append(combined_result.results[0])
+        self.assertEqual(len(job_result.results), 3)
+
+    def test_combine_results_no_copy(self):
+        """Test combining results into a view without copying them."""
+        max_per_job = 5
+        circs = []
+        for i in range(max_per_job*2):
+            new_qc = copy.deepcopy(self._qc)
+            new_qc.name = "test_qc_{}".format(i)
+            circs.append(new_qc)
+        job_set = self._jm.run(circs, backend=self.fake_api_backend,
+                               max_experiments_per_job=max_per_job)
+        result_manager = job_set.results()
+        combined_view = result_manager.combine_results(copy=False)
+
+        combined_result = result_manager.combine_results()
+        self.assertEqual(len(combined_view.results), len(circs))
+        self.assertEqual(list(combined_view.results), combined_result.results)
+        self.assertEqual(combined_view.results[-1], combined_result.results[-1])
+        self.assertEqual(combined_view.results[max_per_job-1:max_per_job+1],
+                         combined_result.results[max_per_job-1:max_per_job+1])
+        with self.assertRaises(IndexError):
+            _ = combined_view.results[len(circs)]
+
+        for i, circ in enumerate(circs):
+            with self.subTest(i=i):
+                self.assertEqual(result_manager.get_counts(i), combined_view.get_counts(i))
+                self.assertEqual(result_manager.get_counts(i),
+                                 combined_view.get_counts(circ.name))
+                self.assertEqual(result_manager.get_counts(i),
+                                 combined_view.get_counts(circ))
+
+        self.assertEqual(combined_view.get_counts(-1), result_manager.get_counts(len(circs)-1))
+        with self.assertRaises(IBMQJobManagerJobNotFound):
+            combined_view.get_counts(len(circs))
+        with self.assertRaises(IBMQJobManagerJobNotFound):
+            combined_view.get_counts("unknown_experiment")
+
+    def test_get_memory_as_array(self):
+        """Test retrieving the memory of an experiment as an array of bits."""
+        job_set = self._jm.run([self._qc]*2, backend=self.sim_backend,
+                               max_experiments_per_job=1, shots=10, memory=True)
+        result_manager = job_set.results()
+
+        for i in range(2):
+            memory = result_manager.get_memory(i)
+            memory_array = result_manager.get_memory(i, as_array=True)
+            self.assertEqual(memory_array.shape, (len(memory), len(memory[0])))
+            self.assertEqual([''.join(map(str, shot)) for shot in memory_array.tolist()],
+                             memory)
+
+    def test_get_memory_as_array_registers(self):
+        """Test retrieving the memory of a circuit with several registers as an array."""
+        qreg = QuantumRegister(2)
+        creg1 = ClassicalRegister(1)
+        creg2 = ClassicalRegister(1)
+        qc = QuantumCircuit(qreg, creg1, creg2)
+        qc.h(qreg[0])
+        qc.cx(qreg[0], qreg[1])
+        qc.measure(qreg[0], creg1[0])
+        qc.measure(qreg[1], creg2[0])
+
+        job_set = self._jm.run([qc], backend=self.sim_backend, shots=10, memory=True)
+        result_manager = job_set.results()
+
+        memory = result_manager.get_memory(0)
+        self.assertIn(' ', memory[0])
+        memory_array = result_manager.get_memory(0, as_array=True)
+        self.assertEqual(memory_array.shape, (len(memory), 2))
+        self.assertEqual([''.join(map(str, shot)) for shot in memory_array.tolist()],
+                         [shot.replace(' ', '') for shot in memory])
+
     def test_ibmq_managed_results_signature(self):
         """Test ``ManagedResults`` and ``Result`` contain the same public methods.
 